@@ -4,13 +4,32 @@ from javax.swing import (JPanel, JButton, JFileChooser, JTextPane, JScrollPane,
                          JCheckBox, JLabel, JTextField, JTabbedPane, BorderFactory, JSpinner,
                          SpinnerNumberModel, UIManager, JTextArea, SwingUtilities)
 from java.awt import BorderLayout, Dimension, Font, GridBagLayout, GridBagConstraints, Insets, FlowLayout
-from java.io import FileOutputStream, OutputStreamWriter, BufferedWriter, File
+from java.io import FileOutputStream, File
+from java.nio import CharBuffer
 from java.nio.charset import Charset
-from java.util import Timer, TimerTask
-from java.util.concurrent import locks
-from java.lang import Thread, Runnable
+from java.util import Timer, TimerTask, ArrayList, Collections, WeakHashMap, Date
+from java.util.concurrent import locks, ArrayBlockingQueue, TimeUnit, ConcurrentLinkedQueue
+from java.util.concurrent.atomic import AtomicInteger, AtomicLong, AtomicBoolean
+from java.lang import Thread, Runnable, StringBuilder, System
+from java.text import SimpleDateFormat
 import datetime, os
 
+# Queued on unload to wake the worker thread so it exits without waiting out a poll
+_SHUTDOWN = object()
+
+# CSV cell sanitization in one pass: commas -> semicolons, newlines -> spaces
+_CSV_TRANS = {ord(u','): u';', ord(u'\n'): u' ', ord(u'\r'): u' '}
+
+
+class WorkItem(object):
+    """Queued HTTP message - pooled and reused by the worker thread"""
+    __slots__ = ('tool_flag', 'message_info', 'is_request')
+
+
+class TrackingEntry(object):
+    """Request data held until the matching response is logged"""
+    __slots__ = ('start_time', 'insertion_points', 'url', 'method', 'host')
+
 
 class BurpExtender(IBurpExtender, IHttpListener, IExtensionStateListener, ITab):
 
@@ -22,15 +41,17 @@ class BurpExtender(IBurpExtender, IHttpListener, IExtensionStateListener, ITab):
         self._callbacks.registerHttpListener(self)
         self._callbacks.registerExtensionStateListener(self)
 
-        # Thread-safe data storage with lock
-        self.log_data = []
-        self.request_counter = 0
+        # Thread-safe data storage - one list per CSV column, guarded by data_lock
+        self._reset_columns()
+        self.request_counter = AtomicInteger(0)
+        self.url_counts = {}  # URL -> times requested, guarded by data_lock
         self.runtime_id = datetime.datetime.now().strftime('%Y%m%d%H%M%S')
-        self.data_lock = locks.ReentrantLock()  # Thread safety for log_data
+        self.data_lock = locks.ReentrantLock()  # Thread safety for log columns and url_counts
         
         # Request tracking for insertion points and timing
-        self.request_tracking = {}
-        self.tracking_lock = locks.ReentrantLock()  # Thread safety for tracking
+        # Keyed by the message itself - entries go away with it if no response arrives
+        self.request_tracking = Collections.synchronizedMap(WeakHashMap())  # IHttpRequestResponse -> TrackingEntry
+        self._tool_name_cache = {}  # Tool flag -> name, worker thread only
 
         # Settings
         self.auto_backup_enabled = True
@@ -39,12 +60,30 @@ class BurpExtender(IBurpExtender, IHttpListener, IExtensionStateListener, ITab):
         self.backup_timer = None
         self.last_backup_time = 0  # Track last backup to prevent over-firing
 
+        # Reusable CSV buffer shared by export, backup and exit paths
+        self._csv_sb = StringBuilder(8192)
+        self._csv_date_format = SimpleDateFormat("yyyy-MM-dd HH:mm:ss")  # Not thread-safe, used under csv_lock
+        self.csv_lock = locks.ReentrantLock()  # Thread safety for CSV buffer, date format and autosave state
+
+        # Incremental auto-backup state: rows already in the autosave file
+        self._last_flushed_index = 0  # Also the log size at the last successful auto-backup
+        self._autosave_path = None
+        self._autosave_appends = 0
+
         # Processing queue and worker thread
-        self.processing_queue = []
-        self.queue_lock = locks.ReentrantLock()
+        # Bounded so a burst (e.g. an Intruder attack) can't exhaust Burp's memory
+        self.processing_queue = ArrayBlockingQueue(16384)
+        self._dropped_count = AtomicLong(0)  # Messages not logged because the queue was full
+        self._dropped_reported = AtomicLong(0)  # Drop count last shown in the status area
+        self._workitem_pool = ConcurrentLinkedQueue()  # Recycled WorkItems, refilled by the worker
         self.worker_thread = None
         self.shutdown_flag = False
 
+        # Status text waiting for the EDT, flushed as one append per burst
+        self._status_buf = StringBuilder()
+        self._status_pending = AtomicBoolean(False)
+        self.status_lock = locks.ReentrantLock()  # Thread safety for _status_buf
+
         self._init_ui()
         self._callbacks.addSuiteTab(self)
         self._start_worker_thread()
@@ -61,42 +100,115 @@ class BurpExtender(IBurpExtender, IHttpListener, IExtensionStateListener, ITab):
                 self.extender = extender
             
             def run(self):
+                queue = self.extender.processing_queue
+                batch = ArrayList(64)
                 while not self.extender.shutdown_flag:
                     try:
-                        # Check if there's work to do
-                        work_item = None
-                        self.extender.queue_lock.lock()
-                        try:
-                            if len(self.extender.processing_queue) > 0:
-                                work_item = self.extender.processing_queue.pop(0)
-                        finally:
-                            self.extender.queue_lock.unlock()
+                        # Take everything already queued (up to 64 items) in one go
+                        queue.drainTo(batch, 64)
+                        if batch.isEmpty():
+                            # Idle - park until work arrives instead of sleeping on an empty queue
+                            work_item = queue.poll(500, TimeUnit.MILLISECONDS)
+                            if work_item is None:
+                                # Queue has drained - a good moment to report any drops
+                                self.extender._report_dropped()
+                                continue
+                            batch.add(work_item)
                         
-                        if work_item:
-                            self.extender._process_request_data(work_item)
-                        else:
-                            # Sleep briefly if queue is empty
-                            Thread.sleep(100)
+                        self.extender._process_batch(batch)
                     except Exception as e:
                         print("[SAVER_LOGGER] Worker thread error: %s" % str(e))
+                    finally:
+                        batch.clear()
         
         self.worker_thread = Thread(Worker(self))
         self.worker_thread.setDaemon(True)
         self.worker_thread.start()
 
-    def _process_request_data(self, work_item):
-        """Process request data in background thread"""
-        try:
-            tool_flag = work_item['tool_flag']
-            message_info = work_item['message_info']
-            is_request = work_item['is_request']
+    def _process_batch(self, batch):
+        """
+        Process a batch of queued messages in background thread.
+        Messages are parsed and requests tracked without locks, then responses
+        are logged under a single acquisition of data_lock.
+        """
+        responses = []
+        for work_item in batch:
+            if work_item is _SHUTDOWN:
+                continue
+            try:
+                tool_flag = work_item.tool_flag
+                message_info = work_item.message_info
+                is_request = work_item.is_request
+                
+                if is_request:
+                    self._handle_request(tool_flag, message_info)
+                else:
+                    responses.append(self._handle_response(tool_flag, message_info))
+            except Exception as e:
+                print("[SAVER_LOGGER] Processing error: %s" % str(e))
             
-            if is_request:
-                self._handle_request(tool_flag, message_info)
-            else:
-                self._handle_response(tool_flag, message_info)
-        except Exception as e:
-            print("[SAVER_LOGGER] Processing error: %s" % str(e))
+            # Return the item to the pool without pinning the message
+            work_item.message_info = None
+            self._workitem_pool.offer(work_item)
+        
+        self.data_lock.lock()
+        try:
+            # Keep queue order so serial numbers follow response order
+            for response in responses:
+                try:
+                    self._complete_response(response)
+                except Exception as e:
+                    print("[SAVER_LOGGER] Processing error: %s" % str(e))
+        finally:
+            self.data_lock.unlock()
+
+    def _report_dropped(self):
+        """Post the drop count to the status area if it grew since the last report"""
+        reported = self._dropped_reported.get()
+        dropped = self._dropped_count.get()
+        if dropped > reported:
+            self._append_status("\n[%s] %d messages dropped since last clear (processing queue was full)" %
+                                (datetime.datetime.now().strftime('%H:%M:%S'), dropped))
+            # Fails if clear_logs reset the baseline meanwhile, which must win
+            self._dropped_reported.compareAndSet(reported, dropped)
+
+    # ------------- LOG STORAGE ------------- #
+
+    def _reset_columns(self):
+        """
+        Start empty log columns - caller holds data_lock once the worker is running.
+        Always replaces the lists rather than emptying them, so snapshots stay valid.
+        """
+        self._col_id = []           # Serial No
+        self._col_host = []         # Host
+        self._col_method = []       # Request Method
+        self._col_url = []          # URL
+        self._col_status = []       # Status Code
+        self._col_tool = []         # Tool Name
+        self._col_count = []        # Request Count
+        self._col_insertion = []    # Insertion Point Count
+        self._col_start = []        # Start Time
+        self._col_end = []          # End Time
+
+    def _log_size(self):
+        """Number of logged rows - the end time column is appended last"""
+        return len(self._col_end)
+
+    def _snapshot_columns(self):
+        """
+        All log columns in CSV order, plus the row count. The lists are not copied:
+        they are only ever appended to and clearing swaps in new ones, so rows
+        below the count never change.
+        """
+        self.data_lock.lock()
+        try:
+            columns = (self._col_id, self._col_host, self._col_method,
+                       self._col_url, self._col_status, self._col_tool,
+                       self._col_count, self._col_insertion, self._col_start,
+                       self._col_end)
+            return columns, len(self._col_end)
+        finally:
+            self.data_lock.unlock()
 
     # ------------- UI ------------- #
 
@@ -240,16 +352,37 @@ class BurpExtender(IBurpExtender, IHttpListener, IExtensionStateListener, ITab):
         JOptionPane.showMessageDialog(self.panel, "Settings saved successfully!")
 
     def _append_status(self, text):
-        """Thread-safe status area update"""
-        class StatusUpdater(Runnable):
-            def __init__(self, status_area, message):
-                self.status_area = status_area
-                self.message = message
+        """Thread-safe status area update - bursts share a single EDT dispatch"""
+        self.status_lock.lock()
+        try:
+            self._status_buf.append(text)
+        finally:
+            self.status_lock.unlock()
+        
+        # Only schedule a flush if one isn't already waiting on the EDT
+        if self._status_pending.compareAndSet(False, True):
+            class StatusUpdater(Runnable):
+                def __init__(self, extender):
+                    self.extender = extender
+                
+                def run(self):
+                    self.extender._flush_status()
             
-            def run(self):
-                self.status_area.append(self.message)
+            SwingUtilities.invokeLater(StatusUpdater(self))
+
+    def _flush_status(self):
+        """Move buffered status text into the status area - runs on the EDT"""
+        # Clear the flag first so text appended from here on schedules another flush
+        self._status_pending.set(False)
+        self.status_lock.lock()
+        try:
+            text = self._status_buf.toString()
+            self._status_buf.setLength(0)
+        finally:
+            self.status_lock.unlock()
         
-        SwingUtilities.invokeLater(StatusUpdater(self.status_area, text))
+        if text:
+            self.status_area.append(text)
 
     # ------------- BACKUP SCHEDULER ------------- #
 
@@ -275,7 +408,6 @@ class BurpExtender(IBurpExtender, IHttpListener, IExtensionStateListener, ITab):
                         self.extender._auto_backup()
                         self.extender.last_backup_time = current_time
 
-        from java.lang import System
         delay = 10000  # 10 seconds initial delay
         period = self.backup_interval_seconds * 1000
         self.backup_timer.schedule(Task(self), delay, period)
@@ -289,54 +421,44 @@ class BurpExtender(IBurpExtender, IHttpListener, IExtensionStateListener, ITab):
         """
         High-volume method - offload processing to background thread
         """
-        # Queue work item for background processing
-        work_item = {
-            'tool_flag': toolFlag,
-            'message_info': messageInfo,
-            'is_request': messageIsRequest
-        }
+        # Queue work item for background processing, reusing a pooled one if available
+        work_item = self._workitem_pool.poll()
+        if work_item is None:
+            work_item = WorkItem()
+        work_item.tool_flag = toolFlag
+        work_item.message_info = messageInfo
+        work_item.is_request = messageIsRequest
         
-        self.queue_lock.lock()
-        try:
-            self.processing_queue.append(work_item)
-        finally:
-            self.queue_lock.unlock()
+        # Never block Burp's thread - drop and count the message if the worker is behind
+        if not self.processing_queue.offer(work_item):
+            if self._dropped_count.incrementAndGet() == 1:
+                self._append_status("\n[%s] Processing queue full - dropping messages until it drains" %
+                                    datetime.datetime.now().strftime('%H:%M:%S'))
+            work_item.message_info = None
+            self._workitem_pool.offer(work_item)
 
     def _handle_request(self, toolFlag, messageInfo):
-        """Handle request in background thread"""
+        """Handle request in background thread - tracks it until the response"""
         req = self._helpers.analyzeRequest(messageInfo)
         url = str(req.getUrl())
-        request_bytes = messageInfo.getRequest()
-        tool = self._callbacks.getToolName(toolFlag)
         
         # Count insertion points
-        insertion_point_count = self._count_insertion_points(req, request_bytes, tool)
-        
-        # Track request start time
-        start_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        insertion_point_count = self._count_insertion_points(req)
         
-        # Get next request ID (thread-safe)
-        self.data_lock.lock()
-        try:
-            req_id = self.request_counter + 1
-        finally:
-            self.data_lock.unlock()
+        # Track request start time (epoch ms, formatted when the CSV is written)
+        start_time = System.currentTimeMillis()
         
-        # Store tracking entry (thread-safe)
-        self.tracking_lock.lock()
-        try:
-            self.request_tracking[req_id] = {
-                'start_time': start_time,
-                'end_time': None,
-                'insertion_points': int(insertion_point_count),
-                'url': url
-            }
-        finally:
-            self.tracking_lock.unlock()
+        # The entry must not reference messageInfo, or the weak key never clears
+        entry = TrackingEntry()
+        entry.start_time = start_time
+        entry.insertion_points = int(insertion_point_count)
+        entry.url = url
+        entry.method = req.getMethod()
+        entry.host = messageInfo.getHttpService().getHost()
+        self.request_tracking.put(messageInfo, entry)
 
     def _handle_response(self, toolFlag, messageInfo):
-        """Handle response in background thread"""
-        req = self._helpers.analyzeRequest(messageInfo)
+        """Parse response in background thread - returns the fields for its log row"""
         res_bytes = messageInfo.getResponse()
 
         status = "-"
@@ -347,91 +469,101 @@ class BurpExtender(IBurpExtender, IHttpListener, IExtensionStateListener, ITab):
             except:
                 status = "Error"
 
-        url = str(req.getUrl())
-        host = messageInfo.getHttpService().getHost()
-        method = req.getMethod()
-        tool = self._callbacks.getToolName(toolFlag)
-        end_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        end_time = System.currentTimeMillis()
+
+        # Get and clean up tracking data in one atomic step
+        tracking = self.request_tracking.remove(messageInfo)
+        if tracking is not None:
+            start_time = tracking.start_time
+            insertion_points = tracking.insertion_points
+            url = tracking.url
+            method = tracking.method
+            host = tracking.host
+        else:
+            # Request was never seen - parse it from the response's message
+            start_time = end_time
+            insertion_points = 0
+            req = self._helpers.analyzeRequest(messageInfo)
+            url = str(req.getUrl())
+            method = req.getMethod()
+            host = messageInfo.getHttpService().getHost()
+
+        return {
+            'host': host,
+            'method': method,
+            'url': url,
+            'status': status,
+            'tool': self._tool_name(toolFlag),
+            'insertion_points': insertion_points,
+            'start_time': start_time,
+            'end_time': end_time
+        }
 
+    def _complete_response(self, response):
+        """Append the log row for a response - caller holds data_lock"""
+        # Read every field up front so nothing can fail between the column appends
+        url = response['url']
+        host = response['host']
+        method = response['method']
+        status = response['status']
+        tool = response['tool']
+        insertion_points = response['insertion_points']
+        start_time = response['start_time']
+        end_time = response['end_time']
+        
         # Thread-safe increment and get
-        self.data_lock.lock()
-        try:
-            self.request_counter += 1
-            current_id = self.request_counter
-            
-            # Count how many times this URL has been requested
-            request_count = sum(1 for entry in self.log_data if entry[3] == url) + 1
-        finally:
-            self.data_lock.unlock()
+        current_id = self.request_counter.incrementAndGet()
         
-        # Get tracking data (thread-safe)
-        self.tracking_lock.lock()
-        try:
-            tracking = self.request_tracking.get(current_id, {})
-            start_time = tracking.get('start_time', end_time)
-            insertion_points = tracking.get('insertion_points', 0)
-            
-            # Clean up tracking data
-            if current_id in self.request_tracking:
-                del self.request_tracking[current_id]
-        finally:
-            self.tracking_lock.unlock()
+        # Count how many times this URL has been requested
+        request_count = self.url_counts.get(url, 0) + 1
+        self.url_counts[url] = request_count
         
-        # Store complete log entry (thread-safe)
-        self.data_lock.lock()
-        try:
-            self.log_data.append([
-                current_id,                 # Serial No
-                host,                       # Host
-                method,                     # Request Method
-                url,                        # URL
-                status,                     # Status Code
-                tool,                       # Tool Name
-                request_count,              # Request Count
-                insertion_points,           # Insertion Point Count
-                start_time,                 # Start Time
-                end_time                    # End Time
-            ])
-        finally:
-            self.data_lock.unlock()
-
-    def _count_insertion_points(self, req, request_bytes, tool):
+        # All columns grow together, keeping rows aligned
+        self._col_id.append(current_id)
+        self._col_host.append(host)
+        self._col_method.append(method)
+        self._col_url.append(url)
+        self._col_status.append(status)
+        self._col_tool.append(tool)
+        self._col_count.append(request_count)
+        self._col_insertion.append(insertion_points)
+        self._col_start.append(start_time)
+        self._col_end.append(end_time)
+
+    def _tool_name(self, tool_flag):
+        """Tool name for a flag - the set of flags is small, so look each up once"""
+        name = self._tool_name_cache.get(tool_flag)
+        if name is None:
+            name = self._callbacks.getToolName(tool_flag)
+            self._tool_name_cache[tool_flag] = name
+        return name
+
+    def _count_insertion_points(self, req):
         """
-        Count insertion points based on tool and request analysis.
+        Count insertion points based on request analysis.
         Note: Intruder removes § markers before sending, so we count parameters instead.
         """
-        insertion_point_count = 0
-        
         try:
             # For all tools: count parameters as potential insertion points
-            params = req.getParameters()
-            if params:
-                insertion_point_count = len(params)
-                
-        except Exception as e:
-            insertion_point_count = 0
-        
-        return insertion_point_count
+            return req.getParameters().size()
+        except Exception:
+            return 0
 
     # ------------- EXPORT + BACKUP ------------- #
 
     def backup_now(self, event):
         """Manual backup button - saves to configured backup folder with timestamp"""
-        timestamp = datetime.datetime.now().strftime('%d%m%Y_%H%M%S')
+        now = datetime.datetime.now()
+        timestamp = now.strftime('%d%m%Y_%H%M%S')
         filename = "SAVER_LOGGER_BACKUP_%s.csv" % timestamp
         filepath = os.path.join(self.backup_folder, filename)
         
-        result = self._write_full_csv(filepath)
+        result = self._write_full_csv(filepath, now)
         if result:
-            count = 0
-            self.data_lock.lock()
-            try:
-                count = len(self.log_data)
-            finally:
-                self.data_lock.unlock()
+            count = self._log_size()
             
             self._append_status("\n[%s] Manual backup completed: %d requests" % 
-                                    (datetime.datetime.now().strftime('%H:%M:%S'), count))
+                                    (now.strftime('%H:%M:%S'), count))
             JOptionPane.showMessageDialog(self.panel, 
                                           "Backup completed successfully!\n%d requests saved to:\n%s" % 
                                           (count, filepath))
@@ -439,39 +571,53 @@ class BurpExtender(IBurpExtender, IHttpListener, IExtensionStateListener, ITab):
             JOptionPane.showMessageDialog(self.panel, "Backup failed! Check console for errors.")
 
     def _auto_backup(self):
-        """Automatic backup triggered by timer - overwrites same file"""
-        self.data_lock.lock()
-        try:
-            has_data = len(self.log_data) > 0
-        finally:
-            self.data_lock.unlock()
+        """Automatic backup triggered by timer - appends new rows to the same file"""
+        # Auto-backup uses a consistent filename (appended to each time)
+        filename = "SAVER_LOGGER_AUTOSAVE.csv"
+        filepath = os.path.join(self.backup_folder, filename)
         
-        if not has_data:
+        # Skip when empty or nothing was logged since the last auto-backup
+        size = self._log_size()
+        if size == 0 or (size == self._last_flushed_index and filepath == self._autosave_path):
             return
         
-        # Auto-backup uses a consistent filename (overwrites each time)
-        filename = "SAVER_LOGGER_AUTOSAVE.csv"
-        filepath = os.path.join(self.backup_folder, filename)
+        now = datetime.datetime.now()
+        result = False
+        self.csv_lock.lock()
+        try:
+            columns, total = self._snapshot_columns()
+            start = self._last_flushed_index
+            
+            # Rewrite the whole file if it is new, moved or the log was cleared, and
+            # every 10th run so the header total doesn't drift too far
+            compact = (start == 0 or start > total or
+                       filepath != self._autosave_path or
+                       not os.path.exists(filepath) or
+                       self._autosave_appends >= 10)
+            
+            if compact:
+                result = self._write_csv(filepath, columns, 0, total, now,
+                                         header=True, footer=False, append=False)
+            else:
+                result = self._write_csv(filepath, columns, start, total, now,
+                                         header=False, footer=False, append=True)
+            
+            if result:
+                self._last_flushed_index = total
+                self._autosave_path = filepath
+                self._autosave_appends = 0 if compact else self._autosave_appends + 1
+        finally:
+            self.csv_lock.unlock()
         
-        result = self._write_full_csv(filepath)
         if result:
-            count = 0
-            self.data_lock.lock()
-            try:
-                count = len(self.log_data)
-            finally:
-                self.data_lock.unlock()
+            count = total
             
             self._append_status("\n[%s] Auto-backup: %d requests saved" % 
-                                    (datetime.datetime.now().strftime('%H:%M:%S'), count))
+                                    (now.strftime('%H:%M:%S'), count))
 
     def export_csv_manual(self, event):
         """Manual CSV export with file chooser"""
-        self.data_lock.lock()
-        try:
-            has_data = len(self.log_data) > 0
-        finally:
-            self.data_lock.unlock()
+        has_data = self._log_size() > 0
         
         if not has_data:
             JOptionPane.showMessageDialog(self.panel, "No data to export!")
@@ -486,14 +632,9 @@ class BurpExtender(IBurpExtender, IHttpListener, IExtensionStateListener, ITab):
             if not filepath.endswith('.csv'):
                 filepath += '.csv'
             
-            result = self._write_full_csv(filepath)
+            result = self._write_full_csv(filepath, datetime.datetime.now())
             if result:
-                count = 0
-                self.data_lock.lock()
-                try:
-                    count = len(self.log_data)
-                finally:
-                    self.data_lock.unlock()
+                count = self._log_size()
                 
                 JOptionPane.showMessageDialog(self.panel, 
                                               "Export successful!\n%d requests saved to:\n%s" % 
@@ -501,50 +642,84 @@ class BurpExtender(IBurpExtender, IHttpListener, IExtensionStateListener, ITab):
             else:
                 JOptionPane.showMessageDialog(self.panel, "Export failed! Check console for errors.")
 
-    def _write_full_csv(self, filepath):
+    def _write_full_csv(self, filepath, now):
         """
         Write ALL log data to a single CSV file with complete column structure.
         Thread-safe implementation.
         """
-        self.data_lock.lock()
-        try:
-            if not self.log_data:
-                return False
-            
-            # Create a snapshot of the data
-            data_snapshot = list(self.log_data)
-        finally:
-            self.data_lock.unlock()
+        columns, total = self._snapshot_columns()
+        if not total:
+            return False
 
+        # Always overwrite with complete data (not append)
+        return self._write_csv(filepath, columns, 0, total, now,
+                               header=True, footer=True, append=False)
+
+    def _write_csv(self, filepath, columns, start, end, now, header, footer, append):
+        """
+        Build the CSV text for rows start..end of columns in the shared buffer and
+        write it in one go. Header and footer totals are end, so only pass them
+        when start is 0. now is the datetime stamped into the metadata. A header
+        without a footer is the autosave header, labelled as a full-rewrite snapshot.
+        """
+        export_time = now.strftime('%Y-%m-%d %H:%M:%S')
+        self.csv_lock.lock()
         try:
-            # Always overwrite with complete data (not append)
-            fos = FileOutputStream(filepath, False)  # False = overwrite
-            writer = BufferedWriter(OutputStreamWriter(fos, Charset.forName("UTF-8")))
-
-            # Header metadata
-            writer.write("# Generated By: SAVER_LOGGER\n")
-            writer.write("# Session ID: %s\n" % self.runtime_id)
-            writer.write("# Export Time: %s\n" % datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
-            writer.write("# Total Requests: %d\n\n" % len(data_snapshot))
-            
-            # Column headers
-            writer.write("Serial No,Host,Request Method,URL,Status Code,Tool Name,Request Count,Insertion Point Count,Start Time,End Time\n")
-
-            # Write ALL data rows
-            for row in data_snapshot:
-                # Sanitize data: replace commas, newlines, and carriage returns
-                safe = [str(col).replace(",", ";").replace("\n", " ").replace("\r", " ") for col in row]
-                writer.write(",".join(safe) + "\n")
-
-            # Footer metadata for authenticity
-            writer.write("\n# --- FOOTER METADATA ---\n")
-            writer.write("# Burp Suite Version: %s\n" % self._callbacks.getBurpVersion()[0])
-            writer.write("# Exported: %s\n" % datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
-            writer.write("# Runtime ID: %s\n" % self.runtime_id)
-            writer.write("# Total Requests Logged: %d\n" % len(data_snapshot))
-
-            writer.flush()
-            writer.close()
+            # Build the whole file in memory (~200 chars per row), then write it once
+            sb = self._csv_sb
+            sb.setLength(0)
+            sb.ensureCapacity((end - start) * 200)
+
+            if header:
+                # Header metadata
+                sb.append("# Generated By: SAVER_LOGGER\n")
+                sb.append("# Session ID: %s\n" % self.runtime_id)
+                if footer:
+                    sb.append("# Export Time: %s\n" % export_time)
+                    sb.append("# Total Requests: %d\n\n" % end)
+                else:
+                    # Autosave file - later runs append rows below this header
+                    sb.append("# Last Full Rewrite: %s\n" % export_time)
+                    sb.append("# Total Requests at Last Full Rewrite: %d\n\n" % end)
+                
+                # Column headers
+                sb.append("Serial No,Host,Request Method,URL,Status Code,Tool Name,Request Count,Insertion Point Count,Start Time,End Time\n")
+
+            # Append data rows
+            (ids, hosts, methods, urls, statuses, tools,
+             counts, insertions, starts, ends) = columns
+            trans = _CSV_TRANS
+            date_format = self._csv_date_format
+            for i in xrange(start, end):
+                # Sanitize free-text columns; numbers, status and times never contain , or newlines
+                sb.append(u",".join((
+                    unicode(ids[i]),
+                    unicode(hosts[i]).translate(trans),
+                    unicode(methods[i]).translate(trans),
+                    unicode(urls[i]).translate(trans),
+                    unicode(statuses[i]),
+                    unicode(tools[i]).translate(trans),
+                    unicode(counts[i]),
+                    unicode(insertions[i]),
+                    date_format.format(Date(starts[i])),
+                    date_format.format(Date(ends[i]))))).append("\n")
+
+            if footer:
+                # Footer metadata for authenticity
+                sb.append("\n# --- FOOTER METADATA ---\n")
+                sb.append("# Burp Suite Version: %s\n" % self._callbacks.getBurpVersion()[0])
+                sb.append("# Exported: %s\n" % export_time)
+                sb.append("# Runtime ID: %s\n" % self.runtime_id)
+                sb.append("# Total Requests Logged: %d\n" % end)
+
+            # Encode the buffer straight to bytes and hand them to the channel in one write
+            data = Charset.forName("UTF-8").encode(CharBuffer.wrap(sb))
+            channel = FileOutputStream(filepath, append).getChannel()  # append=False overwrites
+            try:
+                while data.hasRemaining():
+                    channel.write(data)
+            finally:
+                channel.close()
             return True
 
         except Exception as e:
@@ -552,14 +727,17 @@ class BurpExtender(IBurpExtender, IHttpListener, IExtensionStateListener, ITab):
             import traceback
             traceback.print_exc()
             return False
+        finally:
+            # Don't hold on to a huge buffer between backups
+            if self._csv_sb.capacity() > (1 << 20):
+                self._csv_sb = StringBuilder(8192)
+            else:
+                self._csv_sb.setLength(0)
+            self.csv_lock.unlock()
 
     def clear_logs(self, event):
         """Clear all logged data with confirmation"""
-        self.data_lock.lock()
-        try:
-            count = len(self.log_data)
-        finally:
-            self.data_lock.unlock()
+        count = self._log_size()
         
         confirm = JOptionPane.showConfirmDialog(
             self.panel,
@@ -569,19 +747,27 @@ class BurpExtender(IBurpExtender, IHttpListener, IExtensionStateListener, ITab):
         )
         
         if confirm == JOptionPane.YES_OPTION:
-            self.data_lock.lock()
+            # Same lock order as _auto_backup (csv_lock, then data_lock) so a timer
+            # backup never pairs the old flush index with the new columns
+            self.csv_lock.lock()
             try:
-                cleared_count = len(self.log_data)
-                self.log_data = []
-                self.request_counter = 0
+                self.data_lock.lock()
+                try:
+                    cleared_count = self._log_size()
+                    self._reset_columns()
+                    self.request_counter.set(0)
+                    self.url_counts = {}
+                    self._dropped_count.set(0)
+                    self._dropped_reported.set(0)
+                finally:
+                    self.data_lock.unlock()
+                
+                # Next auto-backup starts a fresh autosave file
+                self._last_flushed_index = 0
             finally:
-                self.data_lock.unlock()
+                self.csv_lock.unlock()
             
-            self.tracking_lock.lock()
-            try:
-                self.request_tracking = {}
-            finally:
-                self.tracking_lock.unlock()
+            self.request_tracking.clear()
             
             self._append_status("\n[%s] All logs cleared (%d requests removed)" % 
                                     (datetime.datetime.now().strftime('%H:%M:%S'), cleared_count))
@@ -604,6 +790,7 @@ class BurpExtender(IBurpExtender, IHttpListener, IExtensionStateListener, ITab):
         """
         # Shutdown worker thread
         self.shutdown_flag = True
+        self.processing_queue.offer(_SHUTDOWN)  # A full queue means the worker isn't parked anyway
         if self.worker_thread:
             try:
                 self.worker_thread.join(5000)  # Wait up to 5 seconds
@@ -615,24 +802,17 @@ class BurpExtender(IBurpExtender, IHttpListener, IExtensionStateListener, ITab):
             self.backup_timer.cancel()
         
         # Final backup on exit with timestamp
-        self.data_lock.lock()
-        try:
-            has_data = len(self.log_data) > 0
-        finally:
-            self.data_lock.unlock()
+        has_data = self._log_size() > 0
         
         if has_data:
-            timestamp = datetime.datetime.now().strftime('%d%m%Y_%H%M%S')
+            now = datetime.datetime.now()
+            timestamp = now.strftime('%d%m%Y_%H%M%S')
             filename = "SAVER_LOGGER_AUTOSAVE_%s.csv" % timestamp
             filepath = os.path.join(self.backup_folder, filename)
             
-            self._write_full_csv(filepath)
+            self._write_full_csv(filepath, now)
             
-            self.data_lock.lock()
-            try:
-                count = len(self.log_data)
-            finally:
-                self.data_lock.unlock()
+            count = self._log_size()
             
             print("[SAVER_LOGGER] Exit backup completed: %d requests saved to %s" % (count, filepath))
         else: